@@ -13,8 +13,10 @@ import math
 import logging
 import os
 import os.path
+import re
 import warnings
 
+from copy import deepcopy
 from functools import lru_cache
 from pathlib import Path
 from PIL import Image
@@ -35,6 +37,15 @@ from deeplabcut.utils.auxfun_videos import VideoReader
 from deeplabcut.pose_estimation_tensorflow.config import load_config
 from deeplabcut.modelzoo.utils import parse_available_supermodels
 
+# Built once at import time to keep them out of the per-call hot paths.
+# The C-accelerated dumper emits identical YAML, just faster.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_SHUFFLE_INDEX_RE = re.compile(r"shuffle(\d+)$")
+_SUPPORTED_NET_KEYWORDS = ("resnet", "mobilenet", "efficientnet", "dlcrnet")
+_VALID_AUGMENTER_TYPES = frozenset(
+    {"default", "scalecrop", "imgaug", "tensorpack", "deterministic"}
+)
+
 
 def comparevideolistsanddatafolders(config):
     """
@@ -58,12 +69,16 @@ def comparevideolistsanddatafolders(config):
     print("Config file contains:", len(video_names))
     print("Labeled-data contains:", len(alldatafolders))
 
+    # Sets for O(1) membership tests in the cross-checks below.
+    video_name_set = set(video_names)
+    datafolder_set = set(alldatafolders)
+
     for vn in video_names:
-        if vn not in alldatafolders:
+        if vn not in datafolder_set:
             print(vn, " is missing as a folder!")
 
     for vn in alldatafolders:
-        if vn not in video_names:
+        if vn not in video_name_set:
             print(vn, " is missing in config file!")
 
 
@@ -384,7 +399,8 @@ def boxitintoacell(joints):
     return outer
 
 
-def ParseYaml(configfile):
+@lru_cache(maxsize=None)
+def _parse_yaml_cached(configfile, mtime):
     raw = open(configfile).read()
     docs = []
     for raw_doc in raw.split("\n---"):
@@ -392,7 +408,16 @@ def ParseYaml(configfile):
             docs.append(yaml.load(raw_doc, Loader=yaml.SafeLoader))
         except SyntaxError:
             docs.append(raw_doc)
-    return docs
+    return tuple(docs)
+
+
+def ParseYaml(configfile):
+    # The template configs are re-read for every shuffle; parse each file only
+    # once (keyed by path and mtime) and hand out deep copies so that callers
+    # may mutate the result freely.
+    configfile = str(configfile)
+    docs = _parse_yaml_cached(configfile, os.path.getmtime(configfile))
+    return [deepcopy(doc) for doc in docs]
 
 
 def MakeTrain_pose_yaml(
@@ -408,7 +433,7 @@ def MakeTrain_pose_yaml(
         docs[0][key] = itemstochange[key]
 
     with open(saveasconfigfile, "w") as f:
-        yaml.dump(docs[0], f)
+        yaml.dump(docs[0], f, Dumper=_YAML_DUMPER)
 
     return docs[0]
 
@@ -438,7 +463,7 @@ def MakeTest_pose_yaml(
 
     dict_test["scoremap_dir"] = "test"
     with open(saveasfile, "w") as f:
-        yaml.dump(dict_test, f)
+        yaml.dump(dict_test, f, Dumper=_YAML_DUMPER)
 
 
 def MakeInference_yaml(itemstochange, saveasconfigfile, defaultconfigfile):
@@ -447,7 +472,7 @@ def MakeInference_yaml(itemstochange, saveasconfigfile, defaultconfigfile):
         docs[0][key] = itemstochange[key]
 
     with open(saveasconfigfile, "w") as f:
-        yaml.dump(docs[0], f)
+        yaml.dump(docs[0], f, Dumper=_YAML_DUMPER)
     return docs[0]
 
 
@@ -734,14 +759,19 @@ def format_training_data(df, train_inds, nbodyparts, project_path):
         outer[0, 0] = array.astype("int64")
         return outer
 
+    # Hoisted out of the loop: per-row df.iloc indexing and rebuilding the
+    # joint-id column are needlessly expensive when repeated per image.
+    filenames = df.index
+    label_values = df.values
+    joint_ids = np.arange(nbodyparts)
     for i in train_inds:
         data = dict()
-        filename = df.index[i]
+        filename = filenames[i]
         data["image"] = filename
         img_shape = read_image_shape_fast(os.path.join(project_path, *filename))
         data["size"] = img_shape
-        temp = df.iloc[i].values.reshape(-1, 2)
-        joints = np.c_[range(nbodyparts), temp]
+        temp = label_values[i].reshape(-1, 2)
+        joints = np.c_[joint_ids, temp]
         joints = joints[~np.isnan(joints).any(axis=1)].astype(int)
         # Check that points lie within the image
         inside = np.logical_and(
@@ -947,12 +977,7 @@ def create_training_dataset(
         if net_type is None:  # loading & linking pretrained models
             net_type = cfg.get("default_net_type", "resnet_50")
         else:
-            if (
-                "resnet" in net_type
-                or "mobilenet" in net_type
-                or "efficientnet" in net_type
-                or "dlcrnet" in net_type
-            ):
+            if any(net in net_type for net in _SUPPORTED_NET_KEYWORDS):
                 pass
             else:
                 raise ValueError("Invalid network type:", net_type)
@@ -963,13 +988,7 @@ def create_training_dataset(
                 # updating variable if null/None! #backwardscompatability
                 auxiliaryfunctions.edit_config(config, {"default_augmenter": "imgaug"})
                 augmenter_type = "imgaug"
-        elif augmenter_type not in [
-            "default",
-            "scalecrop",
-            "imgaug",
-            "tensorpack",
-            "deterministic",
-        ]:
+        elif augmenter_type not in _VALID_AUGMENTER_TYPES:
             raise ValueError("Invalid augmenter type:", augmenter_type)
 
         if posecfg_template:
@@ -1035,13 +1054,17 @@ def create_training_dataset(
 
         bodyparts = cfg["bodyparts"]
         nbodyparts = len(bodyparts)
+        # Resolve every training fraction's index once, outside the split loop.
+        train_frac_indices = {
+            frac: idx for idx, frac in enumerate(cfg["TrainingFraction"])
+        }
         for trainFraction, shuffle, (trainIndices, testIndices) in splits:
             if len(trainIndices) > 0:
                 if userfeedback:
                     trainposeconfigfile, _, _ = training.return_train_network_path(
                         config,
                         shuffle=shuffle,
-                        trainingsetindex=cfg["TrainingFraction"].index(trainFraction),
+                        trainingsetindex=train_frac_indices[trainFraction],
                     )
                     if trainposeconfigfile.is_file():
                         askuser = input(
@@ -1175,11 +1198,15 @@ def get_largestshuffle_index(config):
     dlc_model_path = os.path.join(project_path, "dlc-models", iterate)
     if os.path.isdir(dlc_model_path):
         models = os.listdir(dlc_model_path)
-        # sort the model directories
-        models.sort(key=lambda f: int("".join(filter(str.isdigit, f))))
-
+        # No need to sort all model directories just to find the largest
+        # shuffle; a single pass over the extracted indices suffices.
+        shuffle_indices = (
+            int(m.group(1))
+            for m in map(_SHUFFLE_INDEX_RE.search, models)
+            if m is not None
+        )
         # get the shuffle index and offset by 1.
-        max_shuffle_index = int(models[-1].split("shuffle")[-1]) + 1
+        max_shuffle_index = max(shuffle_indices, default=-1) + 1
     else:
         max_shuffle_index = 0
 
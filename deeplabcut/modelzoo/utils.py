@@ -10,9 +10,12 @@
 #
 import json
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def parse_available_supermodels():
+    # The shipped models.json never changes within a session, so parse it once.
     import deeplabcut
 
     dlc_path = deeplabcut.utils.auxiliaryfunctions.get_deeplabcut_path()
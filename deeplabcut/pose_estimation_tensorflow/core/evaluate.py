@@ -733,6 +733,11 @@ def evaluate_network(
         auxiliaryfunctions.attempt_to_make_folder(
             str(cfg["project_path"] + "/evaluation-results/")
         )
+        # Resolve every training fraction's index once instead of scanning
+        # the config list inside the shuffle loop.
+        train_frac_indices = {
+            frac: idx for idx, frac in enumerate(cfg["TrainingFraction"])
+        }
         for shuffle in Shuffles:
             for trainFraction in TrainingFractions:
                 ##################################################
@@ -753,7 +758,7 @@ def evaluate_network(
                     )
 
                 if trainingsetindex == "all":
-                    train_frac_idx = cfg["TrainingFraction"].index(trainFraction)
+                    train_frac_idx = train_frac_indices[trainFraction]
                 else:
                     train_frac_idx = trainingsetindex
 
@@ -172,6 +172,11 @@ def evaluate_multianimal_full(
     auxiliaryfunctions.attempt_to_make_folder(
         str(cfg["project_path"] + "/evaluation-results/")
     )
+    # Resolve every training fraction's index once instead of scanning
+    # the config list inside the shuffle loop.
+    train_frac_indices = {
+        frac: idx for idx, frac in enumerate(cfg["TrainingFraction"])
+    }
     for shuffle in Shuffles:
         for trainFraction in TrainingFractions:
             ##################################################
@@ -191,7 +196,7 @@ def evaluate_multianimal_full(
                 )
 
             if trainingsetindex == "all":
-                train_frac_idx = cfg["TrainingFraction"].index(trainFraction)
+                train_frac_idx = train_frac_indices[trainFraction]
             else:
                 train_frac_idx = trainingsetindex
 
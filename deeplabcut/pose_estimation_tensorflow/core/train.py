@@ -314,9 +314,21 @@ def train(
     os.chdir(str(start_path))
 
 
-if __name__ == "__main__":
+def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("config", help="Path to yaml configuration file.")
+    parser.add_argument(
+        "configs",
+        nargs="+",
+        help="Path(s) to yaml configuration file(s); one per shuffle to train.",
+    )
     cli_args = parser.parse_args()
 
-    train(Path(cli_args.config).resolve())
+    for config in cli_args.configs:
+        # Clear the graph between shuffles so several can be trained in one
+        # process (mirrors what train_network does when called from the API).
+        tf.compat.v1.reset_default_graph()
+        train(str(Path(config).resolve()), None, None, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,9 @@ import numpy as np
 
 class TripletDataset(Dataset):
     def __init__(self, datasource, transform=None):
-        self.x = datasource
+        # Decode to float32 once up front; converting per triplet in
+        # __getitem__ made every epoch re-pay the same casts.
+        self.x = np.asarray(datasource, dtype=np.float32)
 
         # normalize vectors here
         """
@@ -35,10 +37,6 @@ class TripletDataset(Dataset):
     def __getitem__(self, index):
         anchor, pos, neg = self.x[index]
 
-        anchor = anchor.astype(np.float32)
-        pos = pos.astype(np.float32)
-        neg = neg.astype(np.float32)
-
         if self.transform is not None:
             # maybe needs to convert them to embeddings and position token
 
@@ -9,13 +9,41 @@
 # Licensed under GNU Lesser General Public License v3.0
 #
 
+import os
+
+import torch
 from torch.utils.data import DataLoader
 from .dlc_vec import TripletDataset
 
 
-def make_dlc_dataloader(train_list, test_list, batch_size=64):
+def make_dlc_dataloader(
+    train_list, test_list, batch_size=64, num_workers=None, prefetch_factor=None
+):
+    if num_workers is None:
+        # Keep a few cores free for the training process itself.
+        num_workers = min(4, os.cpu_count() or 1)
+    # Pinned host memory enables faster (and async) host-to-device copies.
+    pin_memory = torch.cuda.is_available()
+    loader_kwargs = dict(
+        batch_size=batch_size,
+        num_workers=num_workers,
+        pin_memory=pin_memory,
+    )
+    # These options are only valid for multi-process loading. Persistent
+    # workers keep the pool alive across epochs instead of re-forking it at
+    # the start of every one — a real saving over a 100-epoch run.
+    if num_workers > 0:
+        loader_kwargs["persistent_workers"] = True
+        if prefetch_factor is not None:
+            loader_kwargs["prefetch_factor"] = prefetch_factor
     train_dataset = TripletDataset(train_list)
-    train_loader = DataLoader(train_dataset, batch_size=batch_size)
+    # Dropping the ragged final batch keeps every training step at the same
+    # shape, so cuDNN benchmark/compiled kernels are never re-tuned for a
+    # one-off batch size. Validation still sees every sample. With fewer
+    # samples than one batch, dropping would leave the loader empty, so keep
+    # the single partial batch in that case.
+    drop_last = len(train_dataset) >= batch_size
+    train_loader = DataLoader(train_dataset, drop_last=drop_last, **loader_kwargs)
     val_dataset = TripletDataset(test_list)
-    val_loader = DataLoader(val_dataset, batch_size=batch_size)
+    val_loader = DataLoader(val_dataset, **loader_kwargs)
     return train_loader, val_loader
@@ -10,6 +10,7 @@
 #
 
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import torch
@@ -28,7 +29,7 @@ from .model import make_dlc_model
 from .solver import make_easy_optimizer
 from .solver.scheduler_factory import create_scheduler
 from .loss import easy_triplet_loss
-from .processor import do_dlc_train
+from .processor import default_device, do_dlc_train
 
 
 def set_seed(seed):
@@ -42,26 +43,80 @@ def set_seed(seed):
     torch.backends.cudnn.benchmark = True
 
 
+def configure_cuda_backends():
+    # The allocator config is read lazily at the first CUDA allocation, so
+    # setting it here, before the model is built, is early enough. Expandable
+    # segments let the caching allocator grow existing blocks instead of
+    # OOM-ing on fragmentation during long training runs. The option only
+    # exists in PyTorch >= 2.1, and older allocators reject unknown keys
+    # outright, hence the version gate.
+    try:
+        torch_version = tuple(int(v) for v in torch.__version__.split(".")[:2])
+    except ValueError:
+        torch_version = (0, 0)
+    if torch_version >= (2, 1):
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+    # Let cuDNN benchmark for the fastest kernels (batch shapes are fixed) and
+    # allow TF32 math on Ampere and newer GPUs; training on keypoint feature
+    # vectors is robust to the reduced mantissa.
+    torch.backends.cudnn.benchmark = True
+    if hasattr(torch.backends.cuda.matmul, "allow_tf32"):
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+    if hasattr(torch, "set_float32_matmul_precision"):
+        # "high" routes fp32 GEMMs through TF32 tensor cores where available.
+        torch.set_float32_matmul_precision("high")
+
+
+def maybe_compile(model):
+    # torch.compile (PyTorch >= 2.0) fuses the transformer forward into
+    # optimized kernels. Where it is unavailable (or fails on this backend),
+    # try TorchScript, which still removes Python dispatch overhead from the
+    # forward; stay eager if neither works.
+    if hasattr(torch, "compile"):
+        try:
+            # Every training batch has the same shape (the ragged final batch
+            # is dropped), so disable dynamic-shape tracing and let the
+            # compiler specialize its kernels for the one static shape.
+            return torch.compile(model, dynamic=False)
+        except Exception as err:
+            print(f"torch.compile failed ({err}); trying TorchScript.")
+    try:
+        return torch.jit.script(model)
+    except Exception as err:
+        print(f"torch.jit.script failed ({err}); continuing with eager execution.")
+        return model
+
+
+def _split_single_video(args):
+    # Read the file in full — np.load's bulk read releases the GIL, which is
+    # what lets the pool's workers actually overlap — then slice in memory.
+    # The full array is dropped on return, so no more than max_workers videos
+    # are ever resident at once.
+    npy_file, indices, num_train = args
+    vectors = np.load(npy_file)
+    return vectors[indices[:num_train]], vectors[indices[num_train:]]
+
+
 def split_train_test(npy_list, train_frac):
     # with npy list form videos, split each to train and test
 
-    x_list = []
-    train_list = []
-    test_list = []
-
-    for npy in npy_list:
-        vectors = np.load(npy)
-        n_samples = vectors.shape[0]
+    # Draw the shuffles in the main thread to keep the global RNG state safe;
+    # opening a memory map just to read the shape costs next to nothing.
+    jobs = []
+    for npy_file in npy_list:
+        n_samples = np.load(npy_file, mmap_mode="r").shape[0]
         indices = np.random.permutation(n_samples)
         num_train = int(n_samples * train_frac)
-        vectors = vectors[indices]
-        train = vectors[:num_train]
-        test = vectors[num_train:]
-        train_list.append(train)
-        test_list.append(test)
+        jobs.append((npy_file, indices, num_train))
+
+    # The per-video files are independent, so read them concurrently; the
+    # workers' bulk file reads run without the GIL.
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(npy_list)))) as executor:
+        splits = list(executor.map(_split_single_video, jobs))
 
-    train_list = np.concatenate(train_list, axis=0)
-    test_list = np.concatenate(test_list, axis=0)
+    train_list = np.concatenate([train for train, _ in splits], axis=0)
+    test_list = np.concatenate([test for _, test in splits], axis=0)
 
     return train_list, test_list
 
@@ -77,7 +132,9 @@ def train_tracking_transformer(
     batch_size=64,
     ckpt_folder="",
     destfolder=None,
+    num_workers=None,
 ):
+    configure_cuda_backends()
     npy_list = []
     videos = auxiliaryfunctions.get_list_of_videos(videos, videotype)
     for video in videos:
@@ -93,12 +150,27 @@ def train_tracking_transformer(
 
     train_list, test_list = split_train_test(npy_list, train_frac)
 
-    train_loader, val_loader = make_dlc_dataloader(train_list, test_list, batch_size)
+    train_loader, val_loader = make_dlc_dataloader(
+        train_list,
+        test_list,
+        batch_size,
+        num_workers=num_workers,
+        prefetch_factor=cfg.get("prefetch_factor"),
+    )
 
     # make my own model factory
     num_kpts = train_list.shape[2]
     feature_dim = train_list.shape[-1]
+    # The datasets hold their own float32 copies of the features; drop the
+    # originals now so DataLoader workers don't inherit them on fork and the
+    # memory is returned before training starts.
+    del train_list, test_list
     model = make_dlc_model(cfg, feature_dim, num_kpts)
+    model = maybe_compile(model)
+    # Move the weights off the host right away: the DataLoader workers fork at
+    # the first iteration, and forking before the transfer would duplicate the
+    # CPU copy of the model into every worker.
+    model.to(default_device(cfg["device"]))
 
     # make my own loss factory
     triplet_loss = easy_triplet_loss()
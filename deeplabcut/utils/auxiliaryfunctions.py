@@ -22,6 +22,8 @@ import os
 import typing
 import pickle
 import warnings
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 import pandas as pd
@@ -31,10 +33,16 @@ from ruamel.yaml import YAML
 from deeplabcut.pose_estimation_tensorflow.lib.trackingutils import TRACK_METHODS
 from deeplabcut.utils import auxfun_videos
 
+# Use the libyaml C extension when available; it parses identical content
+# considerably faster than the pure-Python loader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def create_config_template(multianimal=False):
+
+@lru_cache(maxsize=None)
+def _load_config_template(multianimal=False):
     """
-    Creates a template for config.yaml file. This specific order is preserved while saving as yaml file.
+    Parses the config.yaml template once per session; the template strings are
+    constant, so re-parsing them on every write_config call is wasted work.
     """
     if multianimal:
         yaml_str = """\
@@ -139,8 +147,16 @@ def create_config_template(multianimal=False):
         move2corner:
         """
 
+    return YAML().load(yaml_str)
+
+
+def create_config_template(multianimal=False):
+    """
+    Creates a template for config.yaml file. This specific order is preserved while saving as yaml file.
+    """
+    # Deep-copy the cached template so that callers may mutate it freely.
+    cfg_file = deepcopy(_load_config_template(multianimal))
     ruamelFile = YAML()
-    cfg_file = ruamelFile.load(yaml_str)
     return cfg_file, ruamelFile
 
 
@@ -177,36 +193,48 @@ def create_config_template_3d():
     return cfg_file_3d, ruamelFile_3d
 
 
+@lru_cache(maxsize=32)
+def _read_config_cached(configname, mtime):
+    # Keyed by (path, mtime) so edits on disk invalidate the cached parse.
+    with open(configname, "r") as f:
+        return YAML().load(f)
+
+
 def read_config(configname):
     """
     Reads structured config file defining a project.
     """
-    ruamelFile = YAML()
     path = Path(configname)
-    if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                cfg = ruamelFile.load(f)
-                curr_dir = os.path.dirname(configname)
-                if cfg["project_path"] != curr_dir:
-                    cfg["project_path"] = curr_dir
-                    write_config(configname, cfg)
-        except Exception as err:
-            if len(err.args) > 2:
-                if (
-                    err.args[2]
-                    == "could not determine a constructor for the tag '!!python/tuple'"
-                ):
-                    with open(path, "r") as ymlfile:
-                        cfg = yaml.load(ymlfile, Loader=yaml.SafeLoader)
-                        write_config(configname, cfg)
-                else:
-                    raise
-
-    else:
+    if not os.path.exists(path):
         raise FileNotFoundError(
             "Config file is not found. Please make sure that the file exists and/or that you passed the path of the config file correctly!"
         )
+
+    needs_rewrite = False
+    try:
+        # Callers routinely mutate the returned config, so hand out a copy of
+        # the cached parse rather than the cached object itself.
+        cfg = deepcopy(_read_config_cached(str(path), os.path.getmtime(path)))
+    except Exception as err:
+        if (
+            len(err.args) > 2
+            and err.args[2]
+            == "could not determine a constructor for the tag '!!python/tuple'"
+        ):
+            with open(path, "r") as ymlfile:
+                cfg = yaml.load(ymlfile, Loader=_YAML_LOADER)
+            # Rewrite the file so the legacy tuple tags are purged.
+            needs_rewrite = True
+        else:
+            raise
+
+    # Post-load fixup shared by both loader branches.
+    curr_dir = os.path.dirname(configname)
+    if cfg["project_path"] != curr_dir:
+        cfg["project_path"] = curr_dir
+        needs_rewrite = True
+    if needs_rewrite:
+        write_config(configname, cfg)
     return cfg
 
 
@@ -320,8 +348,10 @@ def attempt_to_make_folder(foldername, recursive=False):
 
 def read_pickle(filename):
     """Read the pickle file"""
+    # Slurp the file in one read and unpickle from memory; much faster than
+    # letting the unpickler issue many small reads on large files.
     with open(filename, "rb") as handle:
-        return pickle.load(handle)
+        return pickle.loads(handle.read())
 
 
 def write_pickle(filename, data):
@@ -420,15 +450,15 @@ def load_metadata(metadatafile):
             trainIndices,
             testIndices,
             testFraction_data,
-        ] = pickle.load(f)
+        ] = pickle.loads(f.read())
         return trainingdata_details, trainIndices, testIndices, testFraction_data
 
 
 def get_immediate_subdirectories(a_dir):
     """Get list of immediate subdirectories"""
-    return [
-        name for name in os.listdir(a_dir) if os.path.isdir(os.path.join(a_dir, name))
-    ]
+    # A single scandir pass avoids one stat call per directory entry.
+    with os.scandir(a_dir) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
 
 
 def grab_files_in_folder(folder, ext="", relative=True):
@@ -544,6 +574,7 @@ def intersection_of_body_parts_and_ones_given_by_user(cfg, comparisonbodyparts):
     if comparisonbodyparts == "all":
         return list(allbpts)
     else:  # take only items in list that are actually bodyparts...
+        comparisonbodyparts = set(comparisonbodyparts)  # O(1) membership tests
         cpbpts = [bp for bp in allbpts if bp in comparisonbodyparts]
         # Ensure same order as in config.yaml
         return cpbpts
@@ -588,11 +619,12 @@ def get_scorer_name(
             str(get_model_folder(trainFraction, shuffle, cfg, modelprefix=modelprefix)),
             "train",
         )
-        Snapshots = np.array(
-            [fn.split(".")[0] for fn in os.listdir(modelfolder) if "index" in fn]
+        # Single pass over the snapshot files; no intermediate arrays and no
+        # second split of every name for the argsort.
+        Snapshots = sorted(
+            (fn.split(".")[0] for fn in os.listdir(modelfolder) if "index" in fn),
+            key=lambda m: int(m.split("-")[1]),
         )
-        increasing_indices = np.argsort([int(m.split("-")[1]) for m in Snapshots])
-        Snapshots = Snapshots[increasing_indices]
         SNP = Snapshots[snapshotindex]
         trainingsiterations = (SNP.split(os.sep)[-1]).split("-")[-1]
 
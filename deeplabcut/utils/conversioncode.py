@@ -257,6 +257,11 @@ def guarantee_multiindex_rows(df):
 
     # Ensure folder names are strings
     try:
+        if df.index.levels[1].dtype == object:
+            # Already strings; skip the costly index rebuild. This function
+            # is often called repeatedly on the same (already converted)
+            # DataFrame, e.g. when merging annotated datasets.
+            return
         df.index = df.index.set_levels(df.index.levels[1].astype(str), level=1)
     except AttributeError:
         pass